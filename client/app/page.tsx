@@ -1,44 +1,104 @@
 'use client';
 
-import { useQuery } from '@tanstack/react-query';
+import { useEffect, useState } from 'react';
+import dynamic from 'next/dynamic';
+import { keepPreviousData, useQuery } from '@tanstack/react-query';
 import { 
-  getSummaryStats, 
   getLacunaByTheme, 
   getRecentProposals,
-  getProposalStats 
+  getProposalStats,
+  LacunaMetric,
 } from '@/lib/api';
-import KPICard from '@/components/KPICard';
-import LacunaChart from '@/components/LacunaChart';
+import KPISection from '@/components/KPISection';
 import ProposalsTable from '@/components/ProposalsTable';
-import { Users, FileText, AlertTriangle, TrendingUp } from 'lucide-react';
+import { DATA_REFRESH_INTERVAL, KPI_REFRESH_INTERVAL } from '@/lib/config';
+import { formatInterval, formatPercent } from '@/lib/format';
+
+const CLASSIFICACAO_TEXT_COLOR: Record<LacunaMetric['classificacao'], string> = {
+  'Alta Lacuna': 'text-red-600',
+  'Média Lacuna': 'text-amber-600',
+  'Baixa Lacuna': 'text-green-600',
+};
+
+const PROPOSALS_PAGE_SIZE = 10;
+
+// recharts is only loaded once there is lacuna data to plot
+const LacunaChart = dynamic(() => import('@/components/LacunaChart'), {
+  ssr: false,
+  loading: () => <div className="bg-white rounded-lg shadow-md p-6 h-[480px] animate-pulse" />,
+});
+
+// Static markup is created once, so React skips it when the queries refresh
+const DASHBOARD_HEADER = (
+  <header className="bg-white shadow-sm">
+    <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-6">
+      <div className="flex items-center justify-between">
+        <div>
+          <h1 className="text-3xl font-bold text-gray-900">🏛️ Voz.Local</h1>
+          <p className="mt-1 text-sm text-gray-500">
+            Dashboard de Engajamento Cidadão e Lacuna Legislativa
+          </p>
+        </div>
+        <div className="text-right">
+          <p className="text-sm text-gray-500">Atualizado agora</p>
+          <div className="flex items-center gap-2 mt-1">
+            <div className="w-2 h-2 bg-green-500 rounded-full animate-pulse"></div>
+            <span className="text-xs text-green-600">Sistema Online</span>
+          </div>
+        </div>
+      </div>
+    </div>
+  </header>
+);
+
+const DASHBOARD_FOOTER = (
+  <footer className="mt-12 text-center text-sm text-gray-500">
+    <p>Voz.Local - Conectando cidadãos ao legislativo</p>
+    <p className="mt-1">
+      {`KPIs atualizados a cada ${formatInterval(KPI_REFRESH_INTERVAL)} · métricas a cada ${formatInterval(DATA_REFRESH_INTERVAL)}`}
+    </p>
+  </footer>
+);
 
 const Home = () => {
-  // Fetch data
-  const { data: summaryStats, isLoading: loadingSummary } = useQuery({
-    queryKey: ['summaryStats'],
-    queryFn: getSummaryStats,
-    refetchInterval: 30000, // Refresh every 30 seconds
-  });
+  const [proposalsPage, setProposalsPage] = useState(0);
 
+  // Fetch data
   const { data: lacunaTheme, isLoading: loadingLacuna } = useQuery({
     queryKey: ['lacunaTheme'],
     queryFn: getLacunaByTheme,
-    refetchInterval: 30000,
+    refetchInterval: DATA_REFRESH_INTERVAL,
   });
 
   const { data: proposalsData, isLoading: loadingProposals } = useQuery({
-    queryKey: ['recentProposals'],
-    queryFn: () => getRecentProposals({ limit: 10 }),
-    refetchInterval: 30000,
+    queryKey: ['recentProposals', proposalsPage],
+    queryFn: () => getRecentProposals({
+      limit: PROPOSALS_PAGE_SIZE,
+      offset: proposalsPage * PROPOSALS_PAGE_SIZE,
+    }),
+    placeholderData: keepPreviousData,
+    refetchInterval: DATA_REFRESH_INTERVAL,
   });
 
+  // Proposals can disappear between refreshes: fall back to the last page that still has rows
+  const proposalsTotal = proposalsData?.pagination.total;
+  useEffect(() => {
+    if (proposalsTotal === undefined) {
+      return;
+    }
+    const lastPage = Math.max(0, Math.ceil(proposalsTotal / PROPOSALS_PAGE_SIZE) - 1);
+    if (proposalsPage > lastPage) {
+      setProposalsPage(lastPage);
+    }
+  }, [proposalsTotal, proposalsPage]);
+
   const { data: proposalStats, isLoading: loadingStats } = useQuery({
     queryKey: ['proposalStats'],
     queryFn: getProposalStats,
-    refetchInterval: 30000,
+    refetchInterval: DATA_REFRESH_INTERVAL,
   });
 
-  const isLoading = loadingSummary || loadingLacuna || loadingProposals || loadingStats;
+  const isLoading = loadingLacuna || loadingProposals || loadingStats;
 
   if (isLoading) {
     return (
@@ -55,59 +115,11 @@ const Home = () => {
 
   return (
     <div className="min-h-screen bg-gray-50">
-      {/* Header */}
-      <header className="bg-white shadow-sm">
-        <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-6">
-          <div className="flex items-center justify-between">
-            <div>
-              <h1 className="text-3xl font-bold text-gray-900">🏛️ Voz.Local</h1>
-              <p className="mt-1 text-sm text-gray-500">
-                Dashboard de Engajamento Cidadão e Lacuna Legislativa
-              </p>
-            </div>
-            <div className="text-right">
-              <p className="text-sm text-gray-500">Atualizado agora</p>
-              <div className="flex items-center gap-2 mt-1">
-                <div className="w-2 h-2 bg-green-500 rounded-full animate-pulse"></div>
-                <span className="text-xs text-green-600">Sistema Online</span>
-              </div>
-            </div>
-          </div>
-        </div>
-      </header>
+      {DASHBOARD_HEADER}
 
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
         {/* KPIs */}
-        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">
-          <KPICard
-            title="Total de Cidadãos"
-            value={summaryStats?.totalCidadaos || 0}
-            icon={Users}
-            colorClass="bg-blue-500"
-          />
-          <KPICard
-            title="Propostas Cidadãs"
-            value={summaryStats?.totalDemandas || 0}
-            icon={FileText}
-            colorClass="bg-green-500"
-          />
-          <KPICard
-            title="PLs em Tramitação"
-            value={summaryStats?.totalPlsTramitacao || 0}
-            icon={TrendingUp}
-            colorClass="bg-purple-500"
-          />
-          <KPICard
-            title="Lacuna Geral"
-            value={`${summaryStats?.percentualLacunaGeral?.toFixed(1) || 0}%`}
-            icon={AlertTriangle}
-            colorClass={
-              (summaryStats?.percentualLacunaGeral || 0) >= 70 ? 'bg-red-500' :
-              (summaryStats?.percentualLacunaGeral || 0) >= 40 ? 'bg-amber-500' :
-              'bg-green-500'
-            }
-          />
-        </div>
+        <KPISection />
 
         {/* Top 5 Lacunas */}
         <div className="mb-8">
@@ -122,7 +134,7 @@ const Home = () => {
             <div className="space-y-3">
               {topLacunas.map((lacuna, index) => (
                 <div 
-                  key={index}
+                  key={lacuna.tema ?? index}
                   className="flex items-center justify-between p-4 bg-gray-50 rounded-lg hover:bg-gray-100 transition-colors"
                 >
                   <div className="flex items-center gap-4">
@@ -138,12 +150,8 @@ const Home = () => {
                   </div>
                   
                   <div className="text-right">
-                    <div className={`text-2xl font-bold ${
-                      lacuna.classificacao === 'Alta Lacuna' ? 'text-red-600' :
-                      lacuna.classificacao === 'Média Lacuna' ? 'text-amber-600' :
-                      'text-green-600'
-                    }`}>
-                      {lacuna.percentualLacuna.toFixed(1)}%
+                    <div className={`text-2xl font-bold ${CLASSIFICACAO_TEXT_COLOR[lacuna.classificacao]}`}>
+                      {formatPercent(lacuna.percentualLacuna)}
                     </div>
                     <p className="text-xs text-gray-500">{lacuna.classificacao}</p>
                   </div>
@@ -187,15 +195,15 @@ const Home = () => {
         </div>
 
         {/* Recent Proposals Table */}
-        {proposalsData && proposalsData.data.length > 0 && (
-          <ProposalsTable proposals={proposalsData.data} />
+        {proposalsData && proposalsData.pagination.total > 0 && (
+          <ProposalsTable
+            proposals={proposalsData.data}
+            pagination={proposalsData.pagination}
+            onPageChange={setProposalsPage}
+          />
         )}
 
-        {/* Footer */}
-        <footer className="mt-12 text-center text-sm text-gray-500">
-          <p>Voz.Local - Conectando cidadãos ao legislativo</p>
-          <p className="mt-1">Dados atualizados automaticamente a cada 30 segundos</p>
-        </footer>
+        {DASHBOARD_FOOTER}
       </main>
     </div>
   );
@@ -0,0 +1,101 @@
+/**
+ * KPI Section Component
+ */
+
+'use client';
+
+import { useQuery } from '@tanstack/react-query';
+import { Users, FileText, AlertTriangle, TrendingUp, LucideIcon } from 'lucide-react';
+import { getSummaryStats, SummaryStats } from '@/lib/api';
+import { KPI_REFRESH_INTERVAL } from '@/lib/config';
+import { formatPercent } from '@/lib/format';
+import KPICard from '@/components/KPICard';
+
+function getLacunaColorClass(percentual: number): string {
+  if (percentual >= 70) return 'bg-red-500';
+  if (percentual >= 40) return 'bg-amber-500';
+  return 'bg-green-500';
+}
+
+interface KPICardConfig {
+  title: string;
+  icon: LucideIcon;
+  colorClass: string | ((stats: SummaryStats) => string);
+  getValue: (stats: SummaryStats) => string | number;
+}
+
+// Card metadata shared by the placeholders and the loaded cards
+const KPI_CARDS: KPICardConfig[] = [
+  {
+    title: 'Total de Cidadãos',
+    icon: Users,
+    colorClass: 'bg-blue-500',
+    getValue: (stats) => stats.totalCidadaos,
+  },
+  {
+    title: 'Propostas Cidadãs',
+    icon: FileText,
+    colorClass: 'bg-green-500',
+    getValue: (stats) => stats.totalDemandas,
+  },
+  {
+    title: 'PLs em Tramitação',
+    icon: TrendingUp,
+    colorClass: 'bg-purple-500',
+    getValue: (stats) => stats.totalPlsTramitacao,
+  },
+  {
+    title: 'Lacuna Geral',
+    icon: AlertTriangle,
+    colorClass: (stats) => getLacunaColorClass(stats.percentualLacunaGeral),
+    getValue: (stats) => formatPercent(stats.percentualLacunaGeral),
+  },
+];
+
+/**
+ * Owns the summary query so the KPI refresh only re-renders this section,
+ * not the charts and tables on the rest of the dashboard.
+ */
+export default function KPISection() {
+  const { data: summaryStats, isError } = useQuery({
+    queryKey: ['summaryStats'],
+    queryFn: getSummaryStats,
+    refetchInterval: KPI_REFRESH_INTERVAL,
+  });
+
+  // No data yet (first load) or the first fetch failed: show placeholders, not zeros
+  if (!summaryStats) {
+    return (
+      <div className="mb-8">
+        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+          {KPI_CARDS.map(({ title }) => (
+            <div
+              key={title}
+              className={`bg-white rounded-lg shadow-md p-6 h-[128px] ${isError ? '' : 'animate-pulse'}`}
+            >
+              <p className="text-sm text-gray-600 font-medium">{title}</p>
+              {isError && <p className="text-3xl font-bold text-gray-300 mt-2">—</p>}
+            </div>
+          ))}
+        </div>
+        {isError && (
+          <p className="mt-2 text-sm text-red-600">Não foi possível carregar os indicadores.</p>
+        )}
+      </div>
+    );
+  }
+
+  return (
+    <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">
+      {KPI_CARDS.map(({ title, icon, colorClass, getValue }) => (
+        <KPICard
+          key={title}
+          title={title}
+          value={getValue(summaryStats)}
+          icon={icon}
+          colorClass={typeof colorClass === 'function' ? colorClass(summaryStats) : colorClass}
+        />
+      ))}
+    </div>
+  );
+}
@@ -5,7 +5,9 @@
 'use client';
 
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, Cell } from 'recharts';
+import { memo, useMemo } from 'react';
 import { LacunaMetric } from '@/lib/api';
+import { formatPercent } from '@/lib/format';
 
 interface LacunaChartProps {
   data: LacunaMetric[];
@@ -13,20 +15,67 @@ interface LacunaChartProps {
   title: string;
 }
 
-const COLORS = {
+const COLORS: Record<LacunaMetric['classificacao'], string> = {
   'Alta Lacuna': '#ef4444',    // red-500
   'Média Lacuna': '#f59e0b',   // amber-500
   'Baixa Lacuna': '#10b981',   // green-500
 };
 
-export default function LacunaChart({ data, dataKey, title }: LacunaChartProps) {
-  const chartData = data.map((item) => ({
-    name: item[dataKey] || 'Não especificado',
-    'Demandas Cidadãos': item.demandasCidadaos,
-    'PLs Tramitação': item.plsTramitacao,
-    'Lacuna %': item.percentualLacuna,
-    classificacao: item.classificacao,
-  }));
+const TEXT_COLORS: Record<LacunaMetric['classificacao'], string> = {
+  'Alta Lacuna': 'text-red-600',
+  'Média Lacuna': 'text-amber-600',
+  'Baixa Lacuna': 'text-green-600',
+};
+
+interface ChartDatum {
+  name: string;
+  'Demandas Cidadãos': number;
+  'PLs Tramitação': number;
+  'Lacuna %': number;
+  classificacao: LacunaMetric['classificacao'];
+  lacunaColor: string;
+}
+
+// Defined once at module scope so hovering does not recreate the renderer
+function renderTooltip({ active, payload }: { active?: boolean; payload?: ReadonlyArray<{ payload?: ChartDatum }> }) {
+  const datum = payload?.[0]?.payload;
+  if (!active || !datum) {
+    return null;
+  }
+
+  return (
+    <div className="bg-white border border-gray-200 rounded-lg shadow-lg p-4">
+      <p className="font-semibold text-gray-900">{datum.name}</p>
+      <p className="text-sm text-blue-600">
+        Demandas: {datum['Demandas Cidadãos']}
+      </p>
+      <p className="text-sm text-green-600">
+        PLs: {datum['PLs Tramitação']}
+      </p>
+      <p className={`text-sm font-bold ${TEXT_COLORS[datum.classificacao]}`}>
+        Lacuna: {formatPercent(datum['Lacuna %'])}
+      </p>
+      <p className="text-xs text-gray-500 mt-1">
+        {datum.classificacao}
+      </p>
+    </div>
+  );
+}
+
+function LacunaChart({ data, dataKey, title }: LacunaChartProps) {
+  // React Query keeps `data` referentially stable between refetches,
+  // so the chart rows are only rebuilt when the metrics actually change
+  const chartData = useMemo<ChartDatum[]>(
+    () => data.map((item) => ({
+      name: item[dataKey] || 'Não especificado',
+      'Demandas Cidadãos': item.demandasCidadaos,
+      'PLs Tramitação': item.plsTramitacao,
+      'Lacuna %': item.percentualLacuna,
+      classificacao: item.classificacao,
+      lacunaColor: COLORS[item.classificacao],
+    })),
+    [data, dataKey],
+  );
 
   return (
     <div className="bg-white rounded-lg shadow-md p-6">
@@ -43,41 +92,13 @@ export default function LacunaChart({ data, dataKey, title }: LacunaChartProps)
             fontSize={12}
           />
           <YAxis />
-          <Tooltip 
-            content={({ active, payload }) => {
-              if (active && payload && payload.length) {
-                const data = payload[0].payload;
-                return (
-                  <div className="bg-white border border-gray-200 rounded-lg shadow-lg p-4">
-                    <p className="font-semibold text-gray-900">{data.name}</p>
-                    <p className="text-sm text-blue-600">
-                      Demandas: {data['Demandas Cidadãos']}
-                    </p>
-                    <p className="text-sm text-green-600">
-                      PLs: {data['PLs Tramitação']}
-                    </p>
-                    <p className={`text-sm font-bold ${
-                      data.classificacao === 'Alta Lacuna' ? 'text-red-600' :
-                      data.classificacao === 'Média Lacuna' ? 'text-amber-600' :
-                      'text-green-600'
-                    }`}>
-                      Lacuna: {data['Lacuna %'].toFixed(1)}%
-                    </p>
-                    <p className="text-xs text-gray-500 mt-1">
-                      {data.classificacao}
-                    </p>
-                  </div>
-                );
-              }
-              return null;
-            }}
-          />
+          <Tooltip content={renderTooltip} />
           <Legend />
           <Bar dataKey="Demandas Cidadãos" fill="#3b82f6" />
           <Bar dataKey="PLs Tramitação" fill="#10b981" />
           <Bar dataKey="Lacuna %" fill="#ef4444">
             {chartData.map((entry, index) => (
-              <Cell key={`cell-${index}`} fill={COLORS[entry.classificacao]} />
+              <Cell key={`cell-${index}`} fill={entry.lacunaColor} />
             ))}
           </Bar>
         </BarChart>
@@ -101,3 +122,7 @@ export default function LacunaChart({ data, dataKey, title }: LacunaChartProps)
     </div>
   );
 }
+
+// Skip re-rendering the chart when the dashboard re-renders for unrelated
+// queries (e.g. paging the proposals table) and the lacuna data is unchanged
+export default memo(LacunaChart);
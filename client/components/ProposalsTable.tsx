@@ -5,14 +5,27 @@
 'use client';
 
 import { Proposta } from '@/lib/api';
-import { formatDistanceToNow } from 'date-fns';
+import { formatPercent } from '@/lib/format';
+import { formatDistance } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 
 interface ProposalsTableProps {
   proposals: Proposta[];
+  pagination?: {
+    total: number;
+    limit: number;
+    offset: number;
+    hasMore: boolean;
+  };
+  onPageChange?: (page: number) => void;
 }
 
-export default function ProposalsTable({ proposals }: ProposalsTableProps) {
+export default function ProposalsTable({ proposals, pagination, onPageChange }: ProposalsTableProps) {
+  const currentPage = pagination ? Math.floor(pagination.offset / pagination.limit) : 0;
+  const totalPages = pagination ? Math.max(1, Math.ceil(pagination.total / pagination.limit)) : 1;
+  // Single reference time for every row instead of one Date.now() per cell
+  const now = new Date();
+
   return (
     <div className="bg-white rounded-lg shadow-md overflow-hidden">
       <div className="px-6 py-4 border-b border-gray-200">
@@ -49,7 +62,7 @@ export default function ProposalsTable({ proposals }: ProposalsTableProps) {
                   </div>
                   {proposta.confidenceScore && (
                     <div className="text-xs text-gray-500 mt-1">
-                      Confiança: {(proposta.confidenceScore * 100).toFixed(0)}%
+                      Confiança: {formatPercent(proposta.confidenceScore * 100, 0)}
                     </div>
                   )}
                 </td>
@@ -71,7 +84,7 @@ export default function ProposalsTable({ proposals }: ProposalsTableProps) {
                   </span>
                 </td>
                 <td className="px-6 py-4 text-sm text-gray-500">
-                  {formatDistanceToNow(new Date(proposta.createdAt), { 
+                  {formatDistance(new Date(proposta.createdAt), now, { 
                     addSuffix: true,
                     locale: ptBR 
                   })}
@@ -87,6 +100,32 @@ export default function ProposalsTable({ proposals }: ProposalsTableProps) {
           Nenhuma proposta encontrada
         </div>
       )}
+
+      {pagination && onPageChange && totalPages > 1 && (
+        <div className="flex items-center justify-between px-6 py-3 border-t border-gray-200">
+          <span className="text-sm text-gray-600">
+            Página {currentPage + 1} de {totalPages} · {pagination.total} propostas
+          </span>
+          <div className="flex gap-2">
+            <button
+              type="button"
+              onClick={() => onPageChange(currentPage - 1)}
+              disabled={currentPage === 0}
+              className="px-3 py-1 text-sm rounded-md border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+            >
+              Anterior
+            </button>
+            <button
+              type="button"
+              onClick={() => onPageChange(currentPage + 1)}
+              disabled={!pagination.hasMore}
+              className="px-3 py-1 text-sm rounded-md border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+            >
+              Próxima
+            </button>
+          </div>
+        </div>
+      )}
     </div>
   );
 }
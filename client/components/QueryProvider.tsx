@@ -6,12 +6,13 @@
 
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import { ReactNode, useState } from 'react';
+import { QUERY_STALE_TIME } from '@/lib/config';
 
 export default function QueryProvider({ children }: { children: ReactNode }) {
   const [queryClient] = useState(() => new QueryClient({
     defaultOptions: {
       queries: {
-        staleTime: 30000, // 30 seconds
+        staleTime: QUERY_STALE_TIME,
         refetchOnWindowFocus: false,
       },
     },
@@ -0,0 +1,12 @@
+/**
+ * Dashboard refresh configuration
+ */
+
+// KPIs visibly change as citizens interact, so they refresh more often
+export const KPI_REFRESH_INTERVAL = 60 * 1000; // 1 minute
+
+// Lacuna metrics and proposal aggregates are cached for 1 hour on the server
+export const DATA_REFRESH_INTERVAL = 5 * 60 * 1000; // 5 minutes
+
+// Default for every query: how long fetched data counts as fresh before a remount refetches it
+export const QUERY_STALE_TIME = 30 * 1000; // 30 seconds
@@ -0,0 +1,22 @@
+/**
+ * Shared display formatters for the dashboard
+ */
+
+/**
+ * Format a 0-100 value as a percentage label, e.g. 72.5 -> "72.5%"
+ */
+export function formatPercent(value: number, fractionDigits = 1): string {
+  return `${value.toFixed(fractionDigits)}%`;
+}
+
+/**
+ * Format a refresh interval in ms as Portuguese text, e.g. 60000 -> "minuto", 300000 -> "5 minutos"
+ */
+export function formatInterval(ms: number): string {
+  const seconds = Math.round(ms / 1000);
+  if (seconds % 60 !== 0) {
+    return seconds === 1 ? 'segundo' : `${seconds} segundos`;
+  }
+  const minutes = seconds / 60;
+  return minutes === 1 ? 'minuto' : `${minutes} minutos`;
+}
@@ -0,0 +1,8 @@
+-- CreateIndex
+CREATE INDEX "idx_pl_status_tema" ON "projetos_lei"("status", "tema_principal");
+
+-- CreateIndex
+CREATE INDEX "idx_pl_status_cidade" ON "projetos_lei"("status", "cidade");
+
+-- CreateIndex
+CREATE INDEX "idx_propostas_grupo" ON "propostas_pauta"("grupo_inclusao");
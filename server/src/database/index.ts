@@ -1,8 +1,27 @@
 import { PrismaClient } from '@prisma/client';
 
+// This client is the server's only pool: size it explicitly unless DATABASE_URL already does
+const POOL_PARAMS: Record<string, string> = {
+  connection_limit: '10',
+  pool_timeout: '20', // seconds to wait for a free connection
+};
+
+function withPoolParams(databaseUrl: string): string {
+  const url = new URL(databaseUrl);
+  Object.entries(POOL_PARAMS).forEach(([key, value]) => {
+    if (!url.searchParams.has(key)) {
+      url.searchParams.set(key, value);
+    }
+  });
+  return url.toString();
+}
+
+const databaseUrl = process.env.DATABASE_URL;
+
 const prisma = new PrismaClient({
   log: process.env.NODE_ENV !== 'production' ? ['warn', 'error'] : [],
   errorFormat: process.env.NODE_ENV !== 'production' ? 'pretty' : 'colorless',
+  datasources: databaseUrl ? { db: { url: withPoolParams(databaseUrl) } } : undefined,
 });
 
 prisma
@@ -52,6 +52,11 @@ export const dataLimiter = rateLimit({
   legacyHeaders: false,
 });
 
+// Parsed once at startup instead of on every webhook request
+const trustedWebhookIps = new Set(
+  (process.env.TRUSTED_WEBHOOK_IPS || '').split(',').filter(Boolean),
+);
+
 /**
  * Lenient rate limiter for webhooks - 1000 requests per hour.
  * Webhooks from trusted sources may have higher limits.
@@ -67,9 +72,8 @@ export const webhookLimiter = rateLimit({
   legacyHeaders: false,
   skip: (req) => {
     // Skip rate limiting for requests from trusted webhook IPs
-    const trustedIps = (process.env.TRUSTED_WEBHOOK_IPS || '').split(',');
     const clientIp = req.ip || '';
-    return trustedIps.includes(clientIp);
+    return trustedWebhookIps.has(clientIp);
   },
 });
 
@@ -6,11 +6,16 @@
 
 import { Router, Request, Response } from 'express';
 import { z } from 'zod';
-import AIClassifier, { TEMAS } from '../services/classifier.service';
+import { Prisma } from '@prisma/client';
+import prisma from '../database';
+import { getAIClassifier, TEMAS } from '../services/classifier.service';
 import { aiLimiter } from '../middlewares/rateLimiter';
 
 const router = Router();
-const aiClassifier = new AIClassifier();
+const aiClassifier = getAIClassifier();
+
+// Most recent proposals compared against in /similar
+const SIMILARITY_CANDIDATES = 200;
 
 // Apply AI rate limiter to all routes in this router
 router.use(aiLimiter);
@@ -29,6 +34,13 @@ const batchClassifySchema = z.object({
   propostas: z.array(z.string().min(10)).max(50, 'Máximo de 50 propostas por lote'),
 });
 
+// Static payload: the theme list never changes at runtime
+const THEMES_RESPONSE = Object.freeze({
+  success: true,
+  data: TEMAS,
+  count: TEMAS.length,
+});
+
 /**
  * POST /api/classifier/theme
  * Classify the theme of a citizen proposal
@@ -94,6 +106,77 @@ router.post('/embedding', async (req: Request, res: Response) => {
   }
 });
 
+/**
+ * POST /api/classifier/similar
+ * Find recent proposals similar to a text
+ */
+router.post('/similar', async (req: Request, res: Response) => {
+  try {
+    const { conteudo, threshold } = similaritySchema.parse(req.body);
+
+    const propostas = await prisma.propostaPauta.findMany({
+      select: { id: true, conteudo: true, embedding: true },
+      orderBy: { timestamp: 'desc' },
+      take: SIMILARITY_CANDIDATES,
+    });
+
+    // Stored embeddings are reused; only the query and proposals saved without one are embedded
+    const withoutEmbedding = propostas.filter((proposta) => !proposta.embedding);
+    const [currentEmbedding, ...newEmbeddings] = await aiClassifier.generateEmbeddings([
+      conteudo,
+      ...withoutEmbedding.map((proposta) => proposta.conteudo),
+    ]);
+
+    // Backfill the missing embeddings in one UPDATE so the next search finds them stored
+    if (withoutEmbedding.length > 0) {
+      const values = withoutEmbedding.map((proposta, index) => Prisma.sql`(
+        ${proposta.id}::int, ${JSON.stringify(newEmbeddings[index])}::text
+      )`);
+
+      await prisma.$executeRaw`
+        UPDATE propostas_pauta AS p
+        SET embedding = v.embedding
+        FROM (VALUES ${Prisma.join(values)}) AS v(id, embedding)
+        WHERE p.id = v.id
+      `;
+    }
+
+    const embeddingsById = new Map<number, number[]>(
+      withoutEmbedding.map((proposta, index) => [proposta.id, newEmbeddings[index]]),
+    );
+
+    const similares = await aiClassifier.findSimilarProposals(
+      currentEmbedding,
+      propostas.map((proposta) => ({
+        id: proposta.id,
+        conteudo: proposta.conteudo,
+        embedding: embeddingsById.get(proposta.id) ?? JSON.parse(proposta.embedding as string),
+      })),
+      threshold,
+    );
+
+    return res.status(200).json({
+      success: true,
+      data: similares,
+      count: similares.length,
+    });
+  } catch (error) {
+    if (error instanceof z.ZodError) {
+      return res.status(400).json({
+        success: false,
+        error: 'Validation error',
+        details: error.issues,
+      });
+    }
+
+    console.error('Error in POST /similar:', error);
+    return res.status(500).json({
+      success: false,
+      error: 'Failed to find similar proposals',
+    });
+  }
+});
+
 /**
  * POST /api/classifier/batch
  * Batch classify multiple proposals
@@ -165,11 +248,7 @@ router.post('/topics', async (req: Request, res: Response) => {
  * Get list of available themes
  */
 router.get('/themes', (req: Request, res: Response) =>
-  res.status(200).json({
-    success: true,
-    data: TEMAS,
-    count: TEMAS.length,
-  }),
+  res.status(200).json(THEMES_RESPONSE),
 );
 
 export default router;
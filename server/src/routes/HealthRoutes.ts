@@ -5,11 +5,10 @@
  */
 
 import { Router, Request, Response } from 'express';
-import { PrismaClient } from '@prisma/client';
+import prisma from '../database';
 import { getRedisCache } from '../services/redis-cache.service';
 
 const router = Router();
-const prisma = new PrismaClient();
 const cache = getRedisCache();
 
 /**
@@ -14,6 +14,27 @@ const metricsCalculator = new MetricsCalculator();
 // Apply data rate limiter to all routes
 router.use(dataLimiter);
 
+/**
+ * GET /api/metrics/lacuna
+ * Get legislative gap metrics by theme, group and city in one response
+ */
+router.get('/lacuna', async (req: Request, res: Response) => {
+  try {
+    const lacunas = await metricsCalculator.calculateAllLacunas();
+
+    res.status(200).json({
+      success: true,
+      data: lacunas,
+    });
+  } catch (error) {
+    console.error('Error in GET /lacuna:', error);
+    res.status(500).json({
+      success: false,
+      error: 'Failed to calculate lacunas',
+    });
+  }
+});
+
 /**
  * GET /api/metrics/lacuna/theme
  * Get legislative gap metrics by theme
@@ -6,12 +6,12 @@
 
 import { Router, Request, Response } from 'express';
 import { z } from 'zod';
-import DataProcessor from '../services/processor.service';
-import AIClassifier from '../services/classifier.service';
+import { getDataProcessor } from '../services/processor.service';
+import { getAIClassifier } from '../services/classifier.service';
 
 const router = Router();
-const dataProcessor = new DataProcessor();
-const aiClassifier = new AIClassifier();
+const dataProcessor = getDataProcessor();
+const aiClassifier = getAIClassifier();
 
 // Validation schemas
 const interactionSchema = z.object({
@@ -86,14 +86,12 @@ router.post('/proposals', async (req: Request, res: Response) => {
     const data = proposalSchema.parse(req.body);
     
     let classification;
+    let embedding;
     
-    // Auto-classify if enabled
+    // Auto-classify if enabled; the embedding is computed once here and stored
+    // with the proposal so similarity searches don't have to re-embed it
     if (data.autoClassify) {
-      try {
-        classification = await aiClassifier.classifyTheme(data.conteudo);
-      } catch (classifyError) {
-        console.warn('Classification failed, continuing without it:', classifyError);
-      }
+      ({ classification, embedding } = await aiClassifier.classifyAndEmbed(data.conteudo));
     }
     
     const proposalData = {
@@ -106,6 +104,7 @@ router.post('/proposals', async (req: Request, res: Response) => {
       temaPrincipal: classification?.temaPrincipal,
       temasSecundarios: classification?.temasSecundarios,
       confidenceScore: classification?.confidenceScore,
+      embedding,
       timestamp: new Date(),
     };
     
@@ -5,11 +5,14 @@
  */
 
 import { Router, Request, Response } from 'express';
-import { PrismaClient } from '@prisma/client';
+import prisma from '../database';
 import { dataLimiter } from '../middlewares/rateLimiter';
+import { getRedisCache, generateProposalsCacheKey } from '../services/redis-cache.service';
 
 const router = Router();
-const prisma = new PrismaClient();
+const cache = getRedisCache();
+
+const MAX_PAGE_SIZE = 100;
 
 // Apply data rate limiter to all routes
 router.use(dataLimiter);
@@ -20,7 +23,7 @@ router.use(dataLimiter);
  */
 router.get('/recent', async (req: Request, res: Response) => {
   try {
-    const limit = parseInt(req.query.limit as string, 10) || 20;
+    const limit = Math.min(parseInt(req.query.limit as string, 10) || 20, MAX_PAGE_SIZE);
     const offset = parseInt(req.query.offset as string, 10) || 0;
     const tema = req.query.tema as string;
     const cidade = req.query.cidade as string;
@@ -95,23 +98,29 @@ router.get('/recent', async (req: Request, res: Response) => {
  */
 router.get('/by-theme', async (req: Request, res: Response) => {
   try {
-    const proposals = await prisma.propostaPauta.groupBy({
-      by: ['tema_principal'],
-      _count: {
-        tema_principal: true,
-      },
-      orderBy: {
-        _count: {
-          tema_principal: 'desc',
-        },
-      },
-    });
+    const formatted = await cache.getOrSet(
+      generateProposalsCacheKey('by-theme', {}),
+      async () => {
+        const proposals = await prisma.propostaPauta.groupBy({
+          by: ['tema_principal'],
+          _count: {
+            tema_principal: true,
+          },
+          orderBy: {
+            _count: {
+              tema_principal: 'desc',
+            },
+          },
+        });
 
-    const formatted = proposals.map((p) => ({
-      tema: p.tema_principal,
-      // eslint-disable-next-line no-underscore-dangle
-            count: p._count.tema_principal,
-    }));
+        return proposals.map((p) => ({
+          tema: p.tema_principal,
+          // eslint-disable-next-line no-underscore-dangle
+          count: p._count.tema_principal,
+        }));
+      },
+      60, // Cache for 1 minute
+    );
 
     return res.status(200).json({
       success: true,
@@ -132,24 +141,30 @@ router.get('/by-theme', async (req: Request, res: Response) => {
  */
 router.get('/by-city', async (req: Request, res: Response) => {
   try {
-    const proposals = await prisma.propostaPauta.groupBy({
-      by: ['cidade'],
-      _count: {
-        cidade: true,
-      },
-      orderBy: {
-        _count: {
-          cidade: 'desc',
-        },
-      },
-      take: 20,
-    });
+    const formatted = await cache.getOrSet(
+      generateProposalsCacheKey('by-city', {}),
+      async () => {
+        const proposals = await prisma.propostaPauta.groupBy({
+          by: ['cidade'],
+          _count: {
+            cidade: true,
+          },
+          orderBy: {
+            _count: {
+              cidade: 'desc',
+            },
+          },
+          take: 20,
+        });
 
-    const formatted = proposals.map((p) => ({
-      cidade: p.cidade,
-      // eslint-disable-next-line no-underscore-dangle
-      count: p._count.cidade,
-    }));
+        return proposals.map((p) => ({
+          cidade: p.cidade,
+          // eslint-disable-next-line no-underscore-dangle
+          count: p._count.cidade,
+        }));
+      },
+      60, // Cache for 1 minute
+    );
 
     return res.status(200).json({
       success: true,
@@ -179,9 +194,21 @@ router.get('/:id', async (req: Request, res: Response) => {
       });
     }
 
+    // Explicit select keeps the stored embedding (1536 floats as JSON) out of the query
     const proposta = await prisma.propostaPauta.findUnique({
       where: { id },
-      include: {
+      select: {
+        id: true,
+        conteudo: true,
+        tema_principal: true,
+        temas_secundarios: true,
+        confidence_score: true,
+        cidade: true,
+        grupo_inclusao: true,
+        tipo_conteudo: true,
+        audio_url: true,
+        timestamp: true,
+        created_at: true,
         cidadao: {
           select: {
             cidade: true,
@@ -233,35 +260,43 @@ router.get('/:id', async (req: Request, res: Response) => {
  */
 router.get('/stats/summary', async (req: Request, res: Response) => {
   try {
-    const [total, byType, avgConfidence] = await Promise.all([
-      prisma.propostaPauta.count(),
-      prisma.propostaPauta.groupBy({
-        by: ['tipo_conteudo'],
-        _count: {
-          tipo_conteudo: true,
-        },
-      }),
-      prisma.propostaPauta.aggregate({
-        _avg: {
-          confidence_score: true,
-        },
-      }),
-    ]);
+    const stats = await cache.getOrSet(
+      generateProposalsCacheKey('stats-summary', {}),
+      async () => {
+        const [total, byType, avgConfidence] = await Promise.all([
+          prisma.propostaPauta.count(),
+          prisma.propostaPauta.groupBy({
+            by: ['tipo_conteudo'],
+            _count: {
+              tipo_conteudo: true,
+            },
+          }),
+          prisma.propostaPauta.aggregate({
+            _avg: {
+              confidence_score: true,
+            },
+          }),
+        ]);
 
-    const typeBreakdown: Record<string, number> = {};
-    byType.forEach((item) => {
-      // eslint-disable-next-line no-underscore-dangle
-      typeBreakdown[item.tipo_conteudo] = item._count.tipo_conteudo;
-    });
+        const typeBreakdown: Record<string, number> = {};
+        byType.forEach((item) => {
+          // eslint-disable-next-line no-underscore-dangle
+          typeBreakdown[item.tipo_conteudo] = item._count.tipo_conteudo;
+        });
+
+        return {
+          total,
+          typeBreakdown,
+          // eslint-disable-next-line no-underscore-dangle
+          averageConfidence: avgConfidence._avg.confidence_score || 0,
+        };
+      },
+      60, // Cache for 1 minute
+    );
 
     return res.status(200).json({
       success: true,
-      data: {
-        total,
-        typeBreakdown,
-        // eslint-disable-next-line no-underscore-dangle
-        averageConfidence: avgConfidence._avg.confidence_score || 0,
-      },
+      data: stats,
     });
   } catch (error) {
     console.error('Error in GET /stats/summary:', error);
@@ -3,11 +3,10 @@
  */
 
 import { Router, Request, Response } from 'express';
-import { PrismaClient } from '@prisma/client';
+import prisma from '../database';
 import twitterService from '../services/twitter.service';
 
 const router = Router();
-const prisma = new PrismaClient();
 
 /**
  * GET /api/twitter/status
@@ -119,6 +118,11 @@ router.post('/tweet/lacuna/:tema', async (req: Request, res: Response) => {
         tipo_agregacao: 'tema',
         chave: tema,
       },
+      select: {
+        percentual_lacuna: true,
+        demandas_cidadaos: true,
+        pls_tramitacao: true,
+      },
       orderBy: {
         created_at: 'desc',
       },
@@ -180,6 +184,10 @@ router.post('/tweet/weekly-summary', async (req: Request, res: Response) => {
       where: {
         tipo_agregacao: 'tema',
       },
+      select: {
+        chave: true,
+        percentual_lacuna: true,
+      },
       orderBy: {
         percentual_lacuna: 'desc',
       },
@@ -5,12 +5,13 @@
  */
 
 import { Router, Request, Response } from 'express';
-import { PrismaClient } from '@prisma/client';
+import prisma from '../database';
 import crypto from 'crypto';
 import twitterService from '../services/twitter.service';
+import { getRedisCache } from '../services/redis-cache.service';
 
 const router = Router();
-const prisma = new PrismaClient();
+const cache = getRedisCache();
 
 // Webhook secret for validating requests (set in environment)
 const WEBHOOK_SECRET = process.env.WEBHOOK_SECRET || 'your-webhook-secret-here';
@@ -137,6 +138,7 @@ router.post('/camara-pls', async (req: Request, res: Response) => {
       });
 
       console.log(`PL updated: ${plId} (ID: ${updated.id})`);
+      await cache.invalidateDashboardMetrics();
 
       return res.status(200).json({
         success: true,
@@ -165,6 +167,7 @@ router.post('/camara-pls', async (req: Request, res: Response) => {
     });
 
     console.log(`New PL created: ${plId} (ID: ${newPL.id})`);
+    await cache.invalidateDashboardMetrics();
 
     // Publica no Twitter sobre o novo PL
     if (twitterService.isEnabled()) {
@@ -302,6 +305,10 @@ router.post('/camara-pls/batch', async (req: Request, res: Response) => {
 
     console.log(`Batch processed: ${created} created, ${updated} updated, ${errors} errors`);
 
+    if (created + updated > 0) {
+      await cache.invalidateDashboardMetrics();
+    }
+
     return res.status(200).json({
       success: true,
       message: 'Batch processed successfully',
@@ -7,10 +7,9 @@
  * Migrated from Python to TypeScript.
  */
 
-import { PrismaClient } from '@prisma/client';
+import prisma from '../database';
 import { getRedisCache, generateMetricsCacheKey } from './redis-cache.service';
 
-const prisma = new PrismaClient();
 const cache = getRedisCache();
 
 export interface LacunaMetric {
@@ -43,118 +42,115 @@ export class MetricsCalculator {
    * Formula: Lacuna = (demandas_cidadaos - pls_tramitacao) / demandas_cidadaos * 100
    */
   async calculateLacunaByTheme(): Promise<LacunaMetric[]> {
-    // Try to get from cache first (TTL: 1 hour = 3600 seconds)
-    const cacheKey = generateMetricsCacheKey('lacuna-theme', {});
-    
-    return cache.getOrSet(
-      cacheKey,
-      async () => {
-        try {
-          // Count citizen demands by theme (assuming PropostaPauta model exists in Prisma)
-          const demandas = await prisma.$queryRaw<Array<{ tema_principal: string; count: bigint }>>`
-            SELECT tema_principal, COUNT(*) as count
-            FROM propostas_pauta
-            WHERE tema_principal IS NOT NULL
-            GROUP BY tema_principal
-          `;
-
-          // Count PLs in tramitação by theme
-          const pls = await prisma.$queryRaw<Array<{ tema_principal: string; count: bigint }>>`
-            SELECT tema_principal, COUNT(*) as count
-            FROM projetos_lei
-            WHERE status = 'tramitacao' AND tema_principal IS NOT NULL
-            GROUP BY tema_principal
-          `;
-
-          // Create lookup map for PLs
-          const plsMap = new Map<string, number>();
-          pls.forEach((pl) => {
-            plsMap.set(pl.tema_principal, Number(pl.count));
-          });
-
-          // Calculate lacuna for each theme
-          const results: LacunaMetric[] = demandas.map(({ tema_principal: tema, count }) => {
-            const demandasCount = Number(count);
-            const plsCount = plsMap.get(tema) || 0;
-
-            // Calculate lacuna percentage
-            let lacuna = 0;
-            if (demandasCount > 0) {
-              lacuna = ((demandasCount - plsCount) / demandasCount) * 100;
-              lacuna = Math.max(0, lacuna); // Ensure non-negative
-            }
-
-            return {
-              tema,
-              demandasCidadaos: demandasCount,
-              plsTramitacao: plsCount,
-              percentualLacuna: Number(lacuna.toFixed(2)),
-              classificacao: this.classifyLacuna(lacuna),
-            };
-          });
-
-          return results.sort((a, b) => b.percentualLacuna - a.percentualLacuna);
-        } catch (error) {
-          console.error('Error calculating lacuna by theme:', error);
-          throw new Error('Failed to calculate lacuna by theme');
-        }
-      },
-      3600, // Cache for 1 hour
-    );
+    const { tema } = await this.calculateAllLacunas();
+    return tema;
   }
 
   /**
    * Calculate legislative gap by inclusion group (Mulheres, PCDs, LGBTQIA+, etc.)
    */
   async calculateLacunaByGroup(): Promise<LacunaMetric[]> {
-    const cacheKey = generateMetricsCacheKey('lacuna-group', {});
-    
+    const { grupo } = await this.calculateAllLacunas();
+    return grupo;
+  }
+
+  /**
+   * Calculate legislative gap by city.
+   */
+  async calculateLacunaByCidade(): Promise<LacunaMetric[]> {
+    const { cidade } = await this.calculateAllLacunas();
+    return cidade;
+  }
+
+  /**
+   * Calculate lacuna by theme, group and city in a single database roundtrip.
+   *
+   * All demand and PL counts come from one UNION ALL query, tagged by dimension.
+   * The per-dimension methods above read their slice from this result.
+   */
+  async calculateAllLacunas(): Promise<{
+    tema: LacunaMetric[];
+    grupo: LacunaMetric[];
+    cidade: LacunaMetric[];
+  }> {
+    const cacheKey = generateMetricsCacheKey('lacuna-all', {});
+
     return cache.getOrSet(
       cacheKey,
       async () => {
         try {
-          // Count citizen demands by group
-          const demandas = await prisma.$queryRaw<Array<{ grupo_inclusao: string; count: bigint }>>`
-            SELECT grupo_inclusao, COUNT(*) as count
+          const rows = await prisma.$queryRaw<Array<{ dimensao: string; chave: string | null; count: bigint }>>`
+            SELECT 'tema' AS dimensao, tema_principal AS chave, COUNT(*) AS count
+            FROM propostas_pauta
+            WHERE tema_principal IS NOT NULL
+            GROUP BY tema_principal
+            UNION ALL
+            SELECT 'grupo', grupo_inclusao, COUNT(*)
             FROM propostas_pauta
             WHERE grupo_inclusao IS NOT NULL
             GROUP BY grupo_inclusao
-          `;
-
-          // Get PLs count (we'll need to match by metadata or other logic)
-          // For now, using a simplified approach
-          const totalPls = await prisma.$queryRaw<Array<{ count: bigint }>>`
-            SELECT COUNT(*) as count
+            UNION ALL
+            SELECT 'cidade', cidade, COUNT(*)
+            FROM propostas_pauta
+            WHERE cidade IS NOT NULL
+            GROUP BY cidade
+            UNION ALL
+            SELECT 'pl_tema', tema_principal, COUNT(*)
+            FROM projetos_lei
+            WHERE status = 'tramitacao' AND tema_principal IS NOT NULL
+            GROUP BY tema_principal
+            UNION ALL
+            SELECT 'pl_cidade', cidade, COUNT(*)
+            FROM projetos_lei
+            WHERE status = 'tramitacao' AND cidade IS NOT NULL
+            GROUP BY cidade
+            UNION ALL
+            SELECT 'pl_total', NULL, COUNT(*)
             FROM projetos_lei
             WHERE status = 'tramitacao'
           `;
 
-          const totalPlsCount = Number(totalPls[0]?.count || 0);
-
-          const results: LacunaMetric[] = demandas.map(({ grupo_inclusao: grupo, count }) => {
-            const demandasCount = Number(count);
-            // Simplified: distribute PLs proportionally (this can be improved)
-            const plsCount = Math.floor(totalPlsCount / demandas.length);
-
-            let lacuna = 0;
-            if (demandasCount > 0) {
-              lacuna = ((demandasCount - plsCount) / demandasCount) * 100;
-              lacuna = Math.max(0, lacuna);
+          const demandas: Record<'tema' | 'grupo' | 'cidade', Array<[string, number]>> = {
+            tema: [],
+            grupo: [],
+            cidade: [],
+          };
+          const plsPorTema = new Map<string, number>();
+          const plsPorCidade = new Map<string, number>();
+          let totalPlsCount = 0;
+
+          rows.forEach(({ dimensao, chave, count }) => {
+            const value = Number(count);
+            if (dimensao === 'pl_tema') {
+              plsPorTema.set(chave as string, value);
+            } else if (dimensao === 'pl_cidade') {
+              plsPorCidade.set(chave as string, value);
+            } else if (dimensao === 'pl_total') {
+              totalPlsCount = value;
+            } else {
+              demandas[dimensao as 'tema' | 'grupo' | 'cidade'].push([chave as string, value]);
             }
-
-            return {
-              grupo,
-              demandasCidadaos: demandasCount,
-              plsTramitacao: plsCount,
-              percentualLacuna: Number(lacuna.toFixed(2)),
-              classificacao: this.classifyLacuna(lacuna),
-            };
           });
 
-          return results.sort((a, b) => b.percentualLacuna - a.percentualLacuna);
+          // PLs are not tagged by group yet: distribute them proportionally (this can be improved)
+          const plsPorGrupo = Math.floor(totalPlsCount / demandas.grupo.length);
+
+          const byLacuna = (a: LacunaMetric, b: LacunaMetric) => b.percentualLacuna - a.percentualLacuna;
+
+          return {
+            tema: demandas.tema
+              .map(([tema, count]) => ({ tema, ...this.buildLacuna(count, plsPorTema.get(tema) || 0) }))
+              .sort(byLacuna),
+            grupo: demandas.grupo
+              .map(([grupo, count]) => ({ grupo, ...this.buildLacuna(count, plsPorGrupo) }))
+              .sort(byLacuna),
+            cidade: demandas.cidade
+              .map(([cidade, count]) => ({ cidade, ...this.buildLacuna(count, plsPorCidade.get(cidade) || 0) }))
+              .sort(byLacuna),
+          };
         } catch (error) {
-          console.error('Error calculating lacuna by group:', error);
-          throw new Error('Failed to calculate lacuna by group');
+          console.error('Error calculating all lacunas:', error);
+          throw new Error('Failed to calculate lacunas');
         }
       },
       3600, // Cache for 1 hour
@@ -162,55 +158,21 @@ export class MetricsCalculator {
   }
 
   /**
-   * Calculate legislative gap by city.
+   * Build the lacuna fields for one segment from its demand and PL counts.
    */
-  async calculateLacunaByCidade(): Promise<LacunaMetric[]> {
-    try {
-      // Count citizen demands by city
-      const demandas = await prisma.$queryRaw<Array<{ cidade: string; count: bigint }>>`
-        SELECT cidade, COUNT(*) as count
-        FROM propostas_pauta
-        WHERE cidade IS NOT NULL
-        GROUP BY cidade
-      `;
-
-      // Count PLs by city
-      const pls = await prisma.$queryRaw<Array<{ cidade: string; count: bigint }>>`
-        SELECT cidade, COUNT(*) as count
-        FROM projetos_lei
-        WHERE status = 'tramitacao' AND cidade IS NOT NULL
-        GROUP BY cidade
-      `;
-
-      const plsMap = new Map<string, number>();
-      pls.forEach((pl) => {
-        plsMap.set(pl.cidade, Number(pl.count));
-      });
-
-      const results: LacunaMetric[] = demandas.map(({ cidade, count }) => {
-        const demandasCount = Number(count);
-        const plsCount = plsMap.get(cidade) || 0;
-
-        let lacuna = 0;
-        if (demandasCount > 0) {
-          lacuna = ((demandasCount - plsCount) / demandasCount) * 100;
-          lacuna = Math.max(0, lacuna);
-        }
-
-        return {
-          cidade,
-          demandasCidadaos: demandasCount,
-          plsTramitacao: plsCount,
-          percentualLacuna: Number(lacuna.toFixed(2)),
-          classificacao: this.classifyLacuna(lacuna),
-        };
-      });
-
-      return results.sort((a, b) => b.percentualLacuna - a.percentualLacuna);
-    } catch (error) {
-      console.error('Error calculating lacuna by cidade:', error);
-      throw new Error('Failed to calculate lacuna by cidade');
+  private buildLacuna(demandasCount: number, plsCount: number): LacunaMetric {
+    let lacuna = 0;
+    if (demandasCount > 0) {
+      lacuna = ((demandasCount - plsCount) / demandasCount) * 100;
+      lacuna = Math.max(0, lacuna);
     }
+
+    return {
+      demandasCidadaos: demandasCount,
+      plsTramitacao: plsCount,
+      percentualLacuna: Number(lacuna.toFixed(2)),
+      classificacao: this.classifyLacuna(lacuna),
+    };
   }
 
   /**
@@ -223,36 +185,51 @@ export class MetricsCalculator {
     totalCidadaos: number;
     totalCidades: number;
   }> {
-    try {
-      const [demandasResult, plsResult, cidadaosResult, cidadesResult] = await Promise.all([
-        prisma.$queryRaw<Array<{ count: bigint }>>`SELECT COUNT(*) as count FROM propostas_pauta`,
-        prisma.$queryRaw<Array<{ count: bigint }>>`SELECT COUNT(*) as count FROM projetos_lei WHERE status = 'tramitacao'`,
-        prisma.$queryRaw<Array<{ count: bigint }>>`SELECT COUNT(*) as count FROM cidadaos`,
-        prisma.$queryRaw<Array<{ count: bigint }>>`SELECT COUNT(DISTINCT cidade) as count FROM propostas_pauta WHERE cidade IS NOT NULL`,
-      ]);
+    const cacheKey = generateMetricsCacheKey('summary', {});
 
-      const totalDemandas = Number(demandasResult[0]?.count || 0);
-      const totalPlsTramitacao = Number(plsResult[0]?.count || 0);
-      const totalCidadaos = Number(cidadaosResult[0]?.count || 0);
-      const totalCidades = Number(cidadesResult[0]?.count || 0);
-
-      let percentualLacunaGeral = 0;
-      if (totalDemandas > 0) {
-        percentualLacunaGeral = ((totalDemandas - totalPlsTramitacao) / totalDemandas) * 100;
-        percentualLacunaGeral = Math.max(0, percentualLacunaGeral);
-      }
+    return cache.getOrSet(
+      cacheKey,
+      async () => {
+        try {
+          // One roundtrip: the four counts as scalar subqueries of a single statement
+          const [counts] = await prisma.$queryRaw<Array<{
+            demandas: bigint;
+            pls: bigint;
+            cidadaos: bigint;
+            cidades: bigint;
+          }>>`
+            SELECT
+              (SELECT COUNT(*) FROM propostas_pauta) AS demandas,
+              (SELECT COUNT(*) FROM projetos_lei WHERE status = 'tramitacao') AS pls,
+              (SELECT COUNT(*) FROM cidadaos) AS cidadaos,
+              (SELECT COUNT(DISTINCT cidade) FROM propostas_pauta WHERE cidade IS NOT NULL) AS cidades
+          `;
 
-      return {
-        totalDemandas,
-        totalPlsTramitacao,
-        percentualLacunaGeral: Number(percentualLacunaGeral.toFixed(2)),
-        totalCidadaos,
-        totalCidades,
-      };
-    } catch (error) {
-      console.error('Error getting summary stats:', error);
-      throw new Error('Failed to get summary statistics');
-    }
+          const totalDemandas = Number(counts?.demandas || 0);
+          const totalPlsTramitacao = Number(counts?.pls || 0);
+          const totalCidadaos = Number(counts?.cidadaos || 0);
+          const totalCidades = Number(counts?.cidades || 0);
+
+          let percentualLacunaGeral = 0;
+          if (totalDemandas > 0) {
+            percentualLacunaGeral = ((totalDemandas - totalPlsTramitacao) / totalDemandas) * 100;
+            percentualLacunaGeral = Math.max(0, percentualLacunaGeral);
+          }
+
+          return {
+            totalDemandas,
+            totalPlsTramitacao,
+            percentualLacunaGeral: Number(percentualLacunaGeral.toFixed(2)),
+            totalCidadaos,
+            totalCidades,
+          };
+        } catch (error) {
+          console.error('Error getting summary stats:', error);
+          throw new Error('Failed to get summary statistics');
+        }
+      },
+      60, // Cache for 1 minute (the dashboard polls these KPIs every minute)
+    );
   }
 }
 
@@ -3,8 +3,12 @@
  * Documentação: https://dadosabertos.camara.leg.br/swagger/api.html
  */
 
+import https from 'https';
 import axios, { AxiosInstance } from 'axios';
 
+// Reutiliza conexões TCP/TLS entre chamadas (fetchProposicaoCompleta faz 4 em paralelo)
+const keepAliveAgent = new https.Agent({ keepAlive: true, maxSockets: 10 });
+
 interface CamaraAPIConfig {
   baseURL: string;
   timeout: number;
@@ -103,6 +107,7 @@ class CamaraAPIService {
     this.client = axios.create({
       baseURL: config?.baseURL || this.baseURL,
       timeout: config?.timeout || 10000,
+      httpsAgent: keepAliveAgent,
       headers: {
         'Accept': 'application/json',
         'User-Agent': 'DevsImpacto/1.0',
@@ -255,6 +260,7 @@ class CamaraAPIService {
       const response = await axios.get(detalhes.urlInteiroTeor, {
         timeout: 15000,
         responseType: 'text',
+        httpsAgent: keepAliveAgent,
       });
 
       return response.data;
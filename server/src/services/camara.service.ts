@@ -1,3 +1,4 @@
+import https from 'https';
 import axios, { AxiosInstance } from 'axios';
 
 interface Proposicao {
@@ -44,6 +45,8 @@ class CamaraAPIService {
   constructor() {
     this.api = axios.create({
       baseURL: 'https://dadosabertos.camara.leg.br/api/v2',
+      // Mantém as conexões abertas entre as chamadas sequenciais da curadoria
+      httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 10 }),
       headers: {
         'Accept': 'application/json',
       },
@@ -151,9 +154,11 @@ class CamaraAPIService {
       const randomIndex = Math.floor(Math.random() * proposicoes.length);
       const proposicaoBasica = proposicoes[randomIndex];
 
-      // Busca detalhes
-      const proposicao = await this.obterProposicao(proposicaoBasica.id);
-      const autores = await this.obterAutores(proposicaoBasica.id);
+      // Busca detalhes e autores em paralelo
+      const [proposicao, autores] = await Promise.all([
+        this.obterProposicao(proposicaoBasica.id),
+        this.obterAutores(proposicaoBasica.id),
+      ]);
       const textoFormatado = this.formatarProposicao(proposicao, autores);
 
       return {
@@ -7,7 +7,11 @@
  * Migrated from Python to TypeScript.
  */
 
+import crypto from 'crypto';
 import OpenAI from 'openai';
+import { getRedisCache } from './redis-cache.service';
+
+const cache = getRedisCache();
 
 // Define valid themes for classification
 export const TEMAS = [
@@ -26,6 +30,15 @@ export const TEMAS = [
 
 export type Tema = typeof TEMAS[number];
 
+// Embedding model; part of the cache key so a model change never serves stale vectors
+const EMBEDDING_MODEL = 'text-embedding-ada-002';
+
+// Inputs per embeddings request (the API accepts up to 2048)
+const EMBEDDING_BATCH_SIZE = 256;
+
+// Embeddings are deterministic per text and model, so they can be cached for long
+const EMBEDDING_CACHE_TTL = 7 * 24 * 60 * 60; // 7 days
+
 export interface ClassificationResult {
   temaPrincipal: Tema;
   temasSecundarios: Tema[];
@@ -53,7 +66,7 @@ export class AIClassifier {
   }
 
   /**
-   * Classify the theme of a citizen proposal using GPT-4.
+   * Classify the theme of a citizen proposal using gpt-4o-mini in JSON mode.
    */
   async classifyTheme(conteudo: string): Promise<ClassificationResult> {
     try {
@@ -82,8 +95,10 @@ Regras:
 `;
 
       const response = await this.client.chat.completions.create({
-        model: 'gpt-4',
+        model: 'gpt-4o-mini',
         messages: [{ role: 'user', content: prompt }],
+        // JSON mode guarantees the reply is a parseable object (no prose or code fences)
+        response_format: { type: 'json_object' },
         temperature: 0.3,
         max_tokens: 500,
       });
@@ -128,38 +143,131 @@ Regras:
     }
   }
 
+  /**
+   * Classify a proposal and generate its embedding in parallel, for storing on insert.
+   * The embedding is left undefined if it cannot be generated.
+   */
+  async classifyAndEmbed(conteudo: string): Promise<{
+    classification: ClassificationResult;
+    embedding?: number[];
+  }> {
+    const [classification, embedding] = await Promise.all([
+      this.classifyTheme(conteudo),
+      this.generateEmbedding(conteudo).catch((embeddingError) => {
+        console.warn('Embedding failed, continuing without it:', embeddingError);
+        return undefined;
+      }),
+    ]);
+
+    return { classification, embedding };
+  }
+
   /**
    * Generate embedding for a text using OpenAI embeddings.
    */
   async generateEmbedding(text: string): Promise<number[]> {
     try {
-      const response = await this.client.embeddings.create({
-        model: 'text-embedding-ada-002',
-        input: text,
-      });
-
-      return response.data[0].embedding;
+      return await cache.getOrSet(
+        this.embeddingCacheKey(text),
+        async () => {
+          const response = await this.client.embeddings.create({
+            model: EMBEDDING_MODEL,
+            input: text,
+          });
+          return response.data[0].embedding;
+        },
+        EMBEDDING_CACHE_TTL,
+      );
     } catch (error) {
       console.error('Error generating embedding:', error);
       throw new Error('Failed to generate embedding');
     }
   }
 
+  /**
+   * Generate embeddings for many texts, sending them in batches instead of one request per text.
+   * Returned embeddings are in the same order as the input texts.
+   */
+  async generateEmbeddings(texts: string[]): Promise<number[][]> {
+    try {
+      const keys = texts.map((text) => this.embeddingCacheKey(text));
+      const embeddings = await cache.getMany<number[]>(keys);
+
+      // Only texts missing from the cache go to the API
+      const missing = embeddings.flatMap((embedding, index) => (embedding ? [] : [index]));
+
+      const batches: number[][] = [];
+      for (let i = 0; i < missing.length; i += EMBEDDING_BATCH_SIZE) {
+        batches.push(missing.slice(i, i + EMBEDDING_BATCH_SIZE));
+      }
+
+      await Promise.all(
+        batches.map(async (indexes) => {
+          const response = await this.client.embeddings.create({
+            model: EMBEDDING_MODEL,
+            input: indexes.map((index) => texts[index]),
+          });
+
+          const entries = response.data.map((item): [string, number[]] => {
+            const index = indexes[item.index];
+            embeddings[index] = item.embedding;
+            return [keys[index], item.embedding];
+          });
+
+          // One pipelined write per batch instead of a SETEX per embedding
+          await cache.setMany(entries, EMBEDDING_CACHE_TTL);
+        }),
+      );
+
+      return embeddings as number[][];
+    } catch (error) {
+      console.error('Error generating embeddings:', error);
+      throw new Error('Failed to generate embeddings');
+    }
+  }
+
+  /**
+   * Cache key for a text's embedding under EMBEDDING_MODEL (hash keeps keys short for long proposals).
+   */
+  private embeddingCacheKey(text: string): string {
+    const hash = crypto.createHash('sha256').update(text).digest('hex');
+    return `embeddings:${EMBEDDING_MODEL}:${hash}`;
+  }
+
+  /**
+   * Euclidean norm of an embedding.
+   */
+  private magnitude(vec: number[]): number {
+    let sum = 0;
+    for (let i = 0; i < vec.length; i += 1) {
+      sum += vec[i] * vec[i];
+    }
+    return Math.sqrt(sum);
+  }
+
   /**
    * Calculate cosine similarity between two embeddings.
+   *
+   * Dot product and the norm of vecB are accumulated in a single pass; pass
+   * magnitudeA when the same vecA is compared against many vectors.
    */
-  private cosineSimilarity(vecA: number[], vecB: number[]): number {
+  private cosineSimilarity(
+    vecA: number[],
+    vecB: number[],
+    magnitudeA = this.magnitude(vecA),
+  ): number {
     if (vecA.length !== vecB.length) {
       throw new Error('Vectors must have the same length');
     }
 
-    // Using Array.prototype.at() for safe array access
-    const dotProduct = vecA.reduce(
-      (sum, value, idx) => sum + value * (vecB.at(idx) ?? 0),
-      0,
-    );
-    const magnitudeA = Math.sqrt(vecA.reduce((sum, value) => sum + value * value, 0));
-    const magnitudeB = Math.sqrt(vecB.reduce((sum, value) => sum + value * value, 0));
+    let dotProduct = 0;
+    let sumSquaresB = 0;
+    for (let i = 0; i < vecB.length; i += 1) {
+      const valueB = vecB[i];
+      dotProduct += vecA[i] * valueB;
+      sumSquaresB += valueB * valueB;
+    }
+    const magnitudeB = Math.sqrt(sumSquaresB);
 
     if (magnitudeA === 0 || magnitudeB === 0) {
       return 0;
@@ -183,9 +291,14 @@ Regras:
   ): Promise<SimilarityResult[]> {
     try {
       const similarities: SimilarityResult[] = [];
+      const currentMagnitude = this.magnitude(currentEmbedding);
 
       existingProposals.forEach((proposal) => {
-        const similarity = this.cosineSimilarity(currentEmbedding, proposal.embedding);
+        const similarity = this.cosineSimilarity(
+          currentEmbedding,
+          proposal.embedding,
+          currentMagnitude,
+        );
 
         if (similarity >= threshold) {
           similarities.push({
@@ -254,4 +367,17 @@ Responda APENAS com uma lista JSON de strings:
   }
 }
 
+// Singleton instance
+let classifierInstance: AIClassifier | null = null;
+
+/**
+ * Get AI classifier singleton (one OpenAI client shared by routes and services).
+ */
+export function getAIClassifier(): AIClassifier {
+  if (!classifierInstance) {
+    classifierInstance = new AIClassifier();
+  }
+  return classifierInstance;
+}
+
 export default AIClassifier;
@@ -7,6 +7,10 @@ import puppeteer, { Browser } from 'puppeteer';
 import * as cheerio from 'cheerio';
 import axios from 'axios';
 
+// Padrões de número de PL, compilados uma única vez para todas as páginas
+const PL_TITLE_REGEX = /\b(?:PL|PEC|PLP)\s*(?:n[º°])?\s*(\d+)[\s/]*(\d{4})\b/i;
+const PL_TEXT_REGEX = /\b(PL|PEC|PLP)\s*(\d+)\/(\d{4})\b/i;
+
 interface TrendingPL {
   plNumber: string; // Ex: "1234/2025"
   title: string;
@@ -86,7 +90,7 @@ class PLScraperService {
         if (!title) return;
 
         // Extrai número do PL do título (aceita variações)
-        const plMatch = title.match(/\b(?:PL|PEC|PLP)\s*(?:n[º°])?\s*(\d+)[\s/]*(\d{4})\b/i);
+        const plMatch = title.match(PL_TITLE_REGEX);
 
         if (plMatch) {
           trending.push({
@@ -138,7 +142,7 @@ class PLScraperService {
         if (!title) return;
 
         // Extrai número do PL
-        const plMatch = title.match(/\b(?:PL|PEC|PLP)\s*(?:n[º°])?\s*(\d+)[\s/]*(\d{4})\b/i);
+        const plMatch = title.match(PL_TITLE_REGEX);
 
         if (plMatch) {
           trending.push({
@@ -197,7 +201,7 @@ class PLScraperService {
         const text = $elem.text();
 
         // Busca padrão de PL no texto
-        const plMatch = text.match(/\b(PL|PEC|PLP)\s*(\d+)\/(\d{4})\b/i);
+        const plMatch = text.match(PL_TEXT_REGEX);
         
         if (plMatch) {
           const ementa = text.replace(plMatch[0], '').trim().slice(0, 200);
@@ -8,9 +8,10 @@
  */
 
 // eslint-disable-next-line max-classes-per-file
-import { PrismaClient } from '@prisma/client';
+import prisma from '../database';
+import { getRedisCache } from './redis-cache.service';
 
-const prisma = new PrismaClient();
+const cache = getRedisCache();
 
 export class ValidationError extends Error {
   constructor(message: string) {
@@ -40,35 +41,52 @@ export interface ProposalData {
   temaPrincipal?: string;
   temasSecundarios?: string[];
   confidenceScore?: number;
+  embedding?: number[];
   timestamp: Date;
 }
 
+// Validation rules, built once instead of on every record
+const INTERACTION_REQUIRED_FIELDS: ReadonlyArray<keyof InteractionData> = [
+  'cidadaoId',
+  'tipoInteracao',
+  'timestamp',
+];
+const VALID_TIPOS_INTERACAO: ReadonlySet<string> = new Set(['opiniao', 'visualizacao', 'reacao']);
+const VALID_TIPOS_INTERACAO_MSG = [...VALID_TIPOS_INTERACAO].join(', ');
+const VALID_OPINIOES: ReadonlySet<string> = new Set(['a_favor', 'contra', 'pular']);
+const VALID_OPINIOES_MSG = [...VALID_OPINIOES].join(', ');
+
+const PROPOSAL_REQUIRED_FIELDS: ReadonlyArray<keyof ProposalData> = [
+  'cidadaoId',
+  'conteudo',
+  'tipoConteudo',
+  'cidade',
+  'timestamp',
+];
+const VALID_TIPOS_CONTEUDO: ReadonlySet<string> = new Set(['texto', 'audio_transcrito']);
+const VALID_TIPOS_CONTEUDO_MSG = [...VALID_TIPOS_CONTEUDO].join(', ');
+
+// Citizens whose telefone_hash -> id mapping is kept in memory (least recently used are evicted)
+const CIDADAO_CACHE_MAX_SIZE = 1000;
+
 export class DataProcessor {
+  // Insertion-ordered, so the first key is always the least recently used
+  private cidadaoIdCache = new Map<string, number>();
+
   /**
    * Validate interaction data has all required fields.
    */
   private validateInteractionData(data: Partial<InteractionData>): asserts data is InteractionData {
-    const requiredFields: Array<keyof InteractionData> = [
-      'cidadaoId',
-      'tipoInteracao',
-      'timestamp',
-    ];
-
-    requiredFields.forEach((field) => {
+    INTERACTION_REQUIRED_FIELDS.forEach((field) => {
       if (!(field in data) || data[field] === undefined) {
         throw new ValidationError(`Missing required field: ${field}`);
       }
     });
 
     // Validate tipoInteracao
-    const validTipos: Array<InteractionData['tipoInteracao']> = [
-      'opiniao',
-      'visualizacao',
-      'reacao',
-    ];
-    if (!validTipos.includes(data.tipoInteracao as InteractionData['tipoInteracao'])) {
+    if (!VALID_TIPOS_INTERACAO.has(data.tipoInteracao as string)) {
       throw new ValidationError(
-        `Invalid tipoInteracao: ${data.tipoInteracao}. Must be one of: ${validTipos.join(', ')}`,
+        `Invalid tipoInteracao: ${data.tipoInteracao}. Must be one of: ${VALID_TIPOS_INTERACAO_MSG}`,
       );
     }
 
@@ -78,10 +96,9 @@ export class DataProcessor {
         throw new ValidationError("Field 'opiniao' is required when tipoInteracao is 'opiniao'");
       }
 
-      const validOpinioes: Array<InteractionData['opiniao']> = ['a_favor', 'contra', 'pular'];
-      if (!validOpinioes.includes(data.opiniao)) {
+      if (!VALID_OPINIOES.has(data.opiniao)) {
         throw new ValidationError(
-          `Invalid opiniao: ${data.opiniao}. Must be one of: ${validOpinioes.join(', ')}`,
+          `Invalid opiniao: ${data.opiniao}. Must be one of: ${VALID_OPINIOES_MSG}`,
         );
       }
     }
@@ -91,25 +108,16 @@ export class DataProcessor {
    * Validate proposal data has all required fields.
    */
   private validateProposalData(data: Partial<ProposalData>): asserts data is ProposalData {
-    const requiredFields: Array<keyof ProposalData> = [
-      'cidadaoId',
-      'conteudo',
-      'tipoConteudo',
-      'cidade',
-      'timestamp',
-    ];
-
-    requiredFields.forEach((field) => {
+    PROPOSAL_REQUIRED_FIELDS.forEach((field) => {
       if (!(field in data) || data[field] === undefined || data[field] === '') {
         throw new ValidationError(`Missing required field: ${field}`);
       }
     });
 
     // Validate tipoConteudo
-    const validTipos: Array<ProposalData['tipoConteudo']> = ['texto', 'audio_transcrito'];
-    if (!validTipos.includes(data.tipoConteudo as ProposalData['tipoConteudo'])) {
+    if (!VALID_TIPOS_CONTEUDO.has(data.tipoConteudo as string)) {
       throw new ValidationError(
-        `Invalid tipoConteudo: ${data.tipoConteudo}. Must be one of: ${validTipos.join(', ')}`,
+        `Invalid tipoConteudo: ${data.tipoConteudo}. Must be one of: ${VALID_TIPOS_CONTEUDO_MSG}`,
       );
     }
 
@@ -130,12 +138,21 @@ export class DataProcessor {
     grupoInclusao?: string;
   }): Promise<{ id: number; created: boolean }> {
     try {
+      // The same citizen usually sends several messages in a row: skip the lookup for them
+      const cachedId = this.cidadaoIdCache.get(data.telefoneHash);
+      if (cachedId !== undefined) {
+        this.rememberCidadao(data.telefoneHash, cachedId);
+        return { id: cachedId, created: false };
+      }
+
       // Try to find existing citizen
       const existing = await prisma.cidadao.findUnique({
         where: { telefone_hash: data.telefoneHash },
+        select: { id: true },
       });
 
       if (existing) {
+        this.rememberCidadao(data.telefoneHash, existing.id);
         return { id: existing.id, created: false };
       }
 
@@ -148,6 +165,7 @@ export class DataProcessor {
         },
       });
 
+      this.rememberCidadao(data.telefoneHash, newCidadao.id);
       return { id: newCidadao.id, created: true };
     } catch (error) {
       console.error('Error in getOrCreateCidadao:', error);
@@ -155,6 +173,19 @@ export class DataProcessor {
     }
   }
 
+  /**
+   * Mark a citizen as most recently used, evicting the oldest one when the cache is full.
+   */
+  private rememberCidadao(telefoneHash: string, id: number): void {
+    this.cidadaoIdCache.delete(telefoneHash);
+    this.cidadaoIdCache.set(telefoneHash, id);
+
+    if (this.cidadaoIdCache.size > CIDADAO_CACHE_MAX_SIZE) {
+      const oldest = this.cidadaoIdCache.keys().next().value as string;
+      this.cidadaoIdCache.delete(oldest);
+    }
+  }
+
   /**
    * Process and persist an interaction to the database.
    */
@@ -209,10 +240,14 @@ export class DataProcessor {
             ? JSON.stringify(data.temasSecundarios)
             : null,
           confidence_score: data.confidenceScore || null,
+          embedding: data.embedding ? JSON.stringify(data.embedding) : null,
           timestamp: data.timestamp,
         },
       });
 
+      // New demand changes the lacuna metrics: drop their cached values
+      await cache.invalidateDashboardMetrics();
+
       console.log(`Proposal processed: ID ${proposta.id}`);
       return { id: proposta.id };
     } catch (error) {
@@ -226,29 +261,80 @@ export class DataProcessor {
 
   /**
    * Batch process multiple interactions.
+   *
+   * Records are validated up front, their citizens and PLs are checked in two
+   * queries, and every valid record is inserted with a single createMany.
    */
   async processInteractionsBatch(
     interactions: Array<Partial<InteractionData>>,
   ): Promise<{ successCount: number; errorCount: number; errors: string[] }> {
-    let successCount = 0;
-    let errorCount = 0;
     const errors: string[] = [];
+    const valid: Array<{ index: number; data: InteractionData }> = [];
+
+    interactions.forEach((interaction, index) => {
+      try {
+        this.validateInteractionData(interaction);
+        valid.push({ index, data: interaction });
+      } catch (error) {
+        const errorMessage =
+          error instanceof Error ? error.message : 'Unknown error';
+        errors.push(`Interaction ${index}: ${errorMessage}`);
+      }
+    });
+
+    if (valid.length === 0) {
+      return { successCount: 0, errorCount: errors.length, errors };
+    }
+
+    let rows = valid;
+
+    try {
+      const cidadaoIds = [...new Set(valid.map(({ data }) => data.cidadaoId))];
+      const plIds = [
+        ...new Set(valid.flatMap(({ data }) => (data.plId ? [data.plId] : []))),
+      ];
 
-    await Promise.allSettled(
-      interactions.map(async (interaction, index) => {
-        try {
-          await this.processInteraction(interaction);
-          successCount += 1;
-        } catch (error) {
-          errorCount += 1;
-          const errorMessage =
-            error instanceof Error ? error.message : 'Unknown error';
-          errors.push(`Interaction ${index}: ${errorMessage}`);
+      const [cidadaos, pls] = await Promise.all([
+        prisma.cidadao.findMany({ where: { id: { in: cidadaoIds } }, select: { id: true } }),
+        prisma.projetoLei.findMany({ where: { id: { in: plIds } }, select: { id: true } }),
+      ]);
+      const existingCidadaos = new Set(cidadaos.map((cidadao) => cidadao.id));
+      const existingPls = new Set(pls.map((pl) => pl.id));
+
+      // Rows that would violate a foreign key are reported instead of failing the whole insert
+      rows = valid.filter(({ index, data }) => {
+        if (!existingCidadaos.has(data.cidadaoId)) {
+          errors.push(`Interaction ${index}: Cidadao ${data.cidadaoId} not found`);
+          return false;
+        }
+        if (data.plId && !existingPls.has(data.plId)) {
+          errors.push(`Interaction ${index}: PL ${data.plId} not found`);
+          return false;
         }
-      }),
-    );
+        return true;
+      });
+
+      const { count } = await prisma.interacao.createMany({
+        data: rows.map(({ data }) => ({
+          cidadao_id: data.cidadaoId,
+          pl_id: data.plId || null,
+          tipo_interacao: data.tipoInteracao,
+          opiniao: data.opiniao || null,
+          conteudo: data.conteudo || null,
+          metadata: data.metadata ? JSON.stringify(data.metadata) : null,
+          timestamp: data.timestamp,
+        })),
+      });
 
-    return { successCount, errorCount, errors };
+      console.log(`Interactions batch processed: ${count} inserted`);
+      return { successCount: count, errorCount: errors.length, errors };
+    } catch (error) {
+      console.error('Error processing interactions batch:', error);
+      rows.forEach(({ index }) => {
+        errors.push(`Interaction ${index}: Failed to process interaction`);
+      });
+      return { successCount: 0, errorCount: errors.length, errors };
+    }
   }
 
   /**
@@ -290,4 +376,17 @@ export class DataProcessor {
   }
 }
 
+// Singleton instance
+let processorInstance: DataProcessor | null = null;
+
+/**
+ * Get data processor singleton.
+ */
+export function getDataProcessor(): DataProcessor {
+  if (!processorInstance) {
+    processorInstance = new DataProcessor();
+  }
+  return processorInstance;
+}
+
 export default DataProcessor;
@@ -7,6 +7,42 @@
 
 import Redis from 'ioredis';
 
+// Metrics computed from propostas_pauta / projetos_lei (see MetricsCalculator)
+const DASHBOARD_METRICS_TYPES = ['lacuna-all', 'summary'];
+const DASHBOARD_PROPOSALS_ENDPOINTS = ['stats-summary', 'by-theme', 'by-city'];
+
+/**
+ * Generate cache key for metrics.
+ */
+export function generateMetricsCacheKey(
+  type: string,
+  params: Record<string, unknown>,
+): string {
+  const entries = Object.entries(params);
+  const sortedParams = entries
+    .sort(([keyA], [keyB]) => keyA.localeCompare(keyB))
+    .map(([key, value]) => `${key}=${String(value)}`)
+    .join('&');
+  
+  return `metrics:${type}:${sortedParams}`;
+}
+
+/**
+ * Generate cache key for proposals.
+ */
+export function generateProposalsCacheKey(
+  endpoint: string,
+  params: Record<string, unknown>,
+): string {
+  const entries = Object.entries(params);
+  const sortedParams = entries
+    .sort(([keyA], [keyB]) => keyA.localeCompare(keyB))
+    .map(([key, value]) => `${key}=${String(value)}`)
+    .join('&');
+  
+  return `proposals:${endpoint}:${sortedParams}`;
+}
+
 export class RedisCacheService {
   private client: Redis;
 
@@ -25,7 +61,8 @@ export class RedisCacheService {
       enableReadyCheck: true,
       retryStrategy: (times) => {
         const delay = Math.min(times * 50, 2000);
-        return delay;
+        // ±20% de jitter para que várias instâncias não reconectem todas no mesmo instante
+        return Math.round(delay * (0.8 + Math.random() * 0.4));
       },
     });
 
@@ -67,6 +104,23 @@ export class RedisCacheService {
     }
   }
 
+  /**
+   * Get several values from cache in one round trip (null for misses).
+   */
+  async getMany<T>(keys: string[]): Promise<Array<T | null>> {
+    try {
+      if (!this.isConnected || keys.length === 0) {
+        return keys.map(() => null);
+      }
+
+      const values = await this.client.mget(...keys);
+      return values.map((value) => (value ? (JSON.parse(value) as T) : null));
+    } catch (error) {
+      console.error('Error getting keys from cache:', error);
+      return keys.map(() => null);
+    }
+  }
+
   /**
    * Set value in cache with optional TTL (in seconds).
    */
@@ -92,6 +146,38 @@ export class RedisCacheService {
     }
   }
 
+  /**
+   * Set several values in one pipelined round trip, all with the same optional TTL (in seconds).
+   */
+  async setMany<T>(entries: Array<[string, T]>, ttlSeconds?: number): Promise<boolean> {
+    try {
+      if (!this.isConnected) {
+        console.warn('⚠️ Redis not connected, skipping cache write');
+        return false;
+      }
+
+      if (entries.length === 0) {
+        return true;
+      }
+
+      const pipeline = this.client.pipeline();
+      entries.forEach(([key, value]) => {
+        const serialized = JSON.stringify(value);
+        if (ttlSeconds) {
+          pipeline.setex(key, ttlSeconds, serialized);
+        } else {
+          pipeline.set(key, serialized);
+        }
+      });
+      await pipeline.exec();
+
+      return true;
+    } catch (error) {
+      console.error('Error setting keys in cache:', error);
+      return false;
+    }
+  }
+
   /**
    * Delete key from cache.
    */
@@ -182,6 +268,27 @@ export class RedisCacheService {
     return this.deletePattern('metrics:*');
   }
 
+  /**
+   * Invalidate the dashboard aggregates after proposals or PLs are written.
+   * Deletes the known keys with a single DEL instead of a KEYS scan.
+   */
+  async invalidateDashboardMetrics(): Promise<boolean> {
+    try {
+      if (!this.isConnected) {
+        return false;
+      }
+
+      await this.client.del(
+        ...DASHBOARD_METRICS_TYPES.map((type) => generateMetricsCacheKey(type, {})),
+        ...DASHBOARD_PROPOSALS_ENDPOINTS.map((endpoint) => generateProposalsCacheKey(endpoint, {})),
+      );
+      return true;
+    } catch (error) {
+      console.error('Error invalidating dashboard metrics cache:', error);
+      return false;
+    }
+  }
+
   /**
    * Invalidate proposals cache.
    */
@@ -276,36 +383,4 @@ export function getRedisCache(): RedisCacheService {
   return cacheInstance;
 }
 
-/**
- * Generate cache key for metrics.
- */
-export function generateMetricsCacheKey(
-  type: string,
-  params: Record<string, unknown>,
-): string {
-  const entries = Object.entries(params);
-  const sortedParams = entries
-    .sort(([keyA], [keyB]) => keyA.localeCompare(keyB))
-    .map(([key, value]) => `${key}=${String(value)}`)
-    .join('&');
-  
-  return `metrics:${type}:${sortedParams}`;
-}
-
-/**
- * Generate cache key for proposals.
- */
-export function generateProposalsCacheKey(
-  endpoint: string,
-  params: Record<string, unknown>,
-): string {
-  const entries = Object.entries(params);
-  const sortedParams = entries
-    .sort(([keyA], [keyB]) => keyA.localeCompare(keyB))
-    .map(([key, value]) => `${key}=${String(value)}`)
-    .join('&');
-  
-  return `proposals:${endpoint}:${sortedParams}`;
-}
-
 export default RedisCacheService;
@@ -9,11 +9,11 @@
  */
 
 import crypto from 'crypto';
-import DataProcessor from './processor.service';
-import AIClassifier from './classifier.service';
+import { getDataProcessor } from './processor.service';
+import { getAIClassifier } from './classifier.service';
 
-const dataProcessor = new DataProcessor();
-const aiClassifier = new AIClassifier();
+const dataProcessor = getDataProcessor();
+const aiClassifier = getAIClassifier();
 
 class WhatsAppIntegrationService {
   /**
@@ -154,9 +154,9 @@ class WhatsAppIntegrationService {
       const cidadaoId = await this.ensureCitizen(data.phoneNumber, data.userName);
       const cidade = this.getCityFromPhone(data.phoneNumber);
 
-      // Classifica automaticamente com AI
+      // Classifica automaticamente com AI e gera o embedding usado na busca por similares
       console.log('🤖 Classificando proposta com AI...');
-      const classification = await aiClassifier.classifyTheme(data.content);
+      const { classification, embedding } = await aiClassifier.classifyAndEmbed(data.content);
 
       // Salva proposta no banco
       const result = await dataProcessor.processProposal({
@@ -169,6 +169,7 @@ class WhatsAppIntegrationService {
         temaPrincipal: classification.temaPrincipal,
         temasSecundarios: classification.temasSecundarios,
         confidenceScore: classification.confidenceScore,
+        embedding,
         timestamp: new Date(),
       });
 